@@ -68,6 +68,28 @@ def randomize_parameters():
     return parameters
 
 
+def split_deterministic_prefix(effects_order, overlay, noise_type):
+    '''
+    Splits the effects order into a deterministic prefix and the remaining effects.
+    The prefix holds every effect before the first randomized one, so it renders
+    the same for every frame and only needs to be computed once.
+    Parameters:
+    - effects_order: The order of the effects.
+    - overlay: The overlay effect.
+    - noise_type: The type of noise to add.
+    '''
+    randomized_effects = {"horizontal_glitch", "vertical_glitch"}
+    if overlay == "light_leak":
+        randomized_effects.add("overlay")
+    if noise_type in ["grain", "speckle"]:
+        randomized_effects.add("noise")
+
+    for index, effect in enumerate(effects_order):
+        if effect in randomized_effects:
+            return effects_order[:index], effects_order[index:]
+    return effects_order, []
+
+
 def apply_glitch_effects(
     image,
     block_size,
@@ -320,14 +342,41 @@ if uploaded_file is not None:
     
     if gif_glitch:
         images_list = []
+        prefix_order, frame_order = split_deterministic_prefix(effects_order, overlay, noise_type)
+        prefix_image = apply_glitch_effects(
+            input_image.copy(),
+            block_size,
+            glitch_chance,
+            color_scale,
+            overlay,
+            prefix_order,
+            num_colors,
+            kaleidoscope_slices,
+            kaleidoscope_angle,
+            kaleidoscope_slice_angle,
+            grain_size,
+            noise_type,
+            sigma,
+            levels,
+            selem_shape,
+            selem_size,
+            k,
+            vignette_intensity,
+            color_intensity,
+            scale
+        )
         for _ in range(25):
+            if not frame_order:
+                # Nothing randomized in the chain, every frame is the same
+                images_list.append(prefix_image)
+                continue
             glitched_image = apply_glitch_effects(
-                input_image.copy(),
+                prefix_image.copy(),
                 block_size,
                 glitch_chance,
                 color_scale,
                 overlay,
-                effects_order,
+                frame_order,
                 num_colors,
                 kaleidoscope_slices,
                 kaleidoscope_angle,